@@ -5,6 +5,8 @@ separated from _resolve.py for organizational clarity.
 
 """
 
+import weakref
+
 from . import types as _types
 from .exceptions import ResolutionError
 from ._utils import deep_update
@@ -20,6 +22,17 @@ from ._internals import (
 )
 
 
+# resolved splice sources, per root node and keypath string. Dict and list nodes rebuild
+# their result on every resolve(), but leaf values and function-call results are
+# memoized per node, so resolving a keypath against a given root is deterministic and
+# the result can be reused. make_node never mutates its input, so the data can be
+# shared. The cache is keyed weakly on the root node, which lives only as long as its
+# resolve() call, so each root's entries are dropped along with its tree.
+_SPLICE_CACHE: weakref.WeakKeyDictionary[
+    _ConcreteNode, dict[str, _types.Configuration]
+] = weakref.WeakKeyDictionary()
+
+
 @_types.Function.new(resolve_input=False)
 def _splice(args: _types.FunctionArgs) -> _ConcreteNode:
     """Copy a subtree from elsewhere in the configuration.
@@ -33,14 +46,21 @@ def _splice(args: _types.FunctionArgs) -> _ConcreteNode:
         raise ResolutionError("Input to 'splice' must be a string.", args.keypath)
     root = args._root_node
     assert isinstance(root, (_DictNode, _ListNode, _FunctionCallNode))
-    try:
-        source_node = root.get_keypath(args.input)
-    except KeyError:
-        raise ResolutionError(f"Keypath '{args.input}' does not exist.", args.keypath)
 
-    # Resolve the source, then rebuild with the target schema so that type
+    cache = _SPLICE_CACHE.setdefault(root, {})
+    if args.input in cache:
+        spliced_data = cache[args.input]
+    else:
+        try:
+            source_node = root.get_keypath(args.input)
+        except KeyError:
+            raise ResolutionError(
+                f"Keypath '{args.input}' does not exist.", args.keypath
+            )
+        spliced_data = cache[args.input] = source_node.resolve()
+
+    # Rebuild the resolved source with the target schema so that type
     # conversion is applied according to the splice destination.
-    spliced_data = source_node.resolve()
     return make_node(
         spliced_data,
         args.schema,
@@ -223,7 +243,7 @@ def _if(args: _types.FunctionArgs) -> _types.Configuration:
 
     """
     # check that the input is valid
-    if not isinstance(args.input, dict):
+    if type(args.input) is not dict:
         raise ResolutionError("Input to 'if' must be a dictionary.", args.keypath)
 
     # check that the keys are exactly "condition", "then" and "else"
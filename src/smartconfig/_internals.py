@@ -213,11 +213,14 @@ When resolve() is called on this configuration, the following major steps occur:
 from typing import (
     Any,
     Callable,
+    Iterator,
     Mapping,
     TypedDict,
 )
 import abc
 import enum
+import functools
+import sys
 import typing
 
 import jinja2
@@ -249,12 +252,41 @@ class ResolutionMode(enum.Enum):
 # triggers the resolution of that element if it is a function node or a value node.
 # Otherwise, it returns another unresolved container.
 
+
+def _wrap_child(
+    child: _ConcreteNode,
+) -> _UnresolvedDict | _UnresolvedList | _types.Configuration:
+    """Present a child node to the user of an unresolved container.
+
+    If the child is a _ValueNode, this resolves it. If it is a _DictNode or _ListNode,
+    this returns another unresolved container. If it is a _FunctionCallNode, this
+    evaluates the function and returns an unresolved container if the result is a
+    collection, or the resolved value otherwise.
+
+    """
+    if isinstance(child, _FunctionCallNode):
+        # evaluate the function to turn it into a Dict, List, or Value node
+        child = child.evaluate()
+
+    # leaves are by far the most common children, so they are checked first
+    if isinstance(child, _ValueNode):
+        return child.resolve()
+    elif isinstance(child, _DictNode):
+        return _UnresolvedDict(child)
+    elif isinstance(child, _ListNode):
+        return _UnresolvedList(child)
+    else:
+        raise TypeError(f"Unexpected node type: {type(child)}")  # pragma: no cover
+
+
 # _UnresolvedDict ----------------------------------------------------------------------
 
 
 class _UnresolvedDict(_types.UnresolvedDict):
     """Implements UnresolvedDict using a _DictNode as the backing data structure."""
 
+    __slots__ = ("dict_node",)
+
     def __init__(self, dict_node: _DictNode):
         self.dict_node = dict_node
 
@@ -271,31 +303,20 @@ class _UnresolvedDict(_types.UnresolvedDict):
         If the key is not found, a KeyError is raised.
 
         """
-        child = self.dict_node.children[key]
-
-        if isinstance(child, _FunctionCallNode):
-            # evaluate the function to turn it into a Dict, List, or Value node
-            child = child.evaluate()
-
-        if isinstance(child, _DictNode):
-            return _UnresolvedDict(child)
-        elif isinstance(child, _ListNode):
-            return _UnresolvedList(child)
-        elif isinstance(child, _ValueNode):
-            return child.resolve()
+        return _wrap_child(self.dict_node.children[key])
 
     def __len__(self):
         return len(self.dict_node.children)
 
-    def __iter__(self):
-        return iter(self.keys())
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.dict_node.children)
 
     def keys(self):
         return self.dict_node.children.keys()
 
     def values(self):
-        for key in self.keys():
-            yield self[key]
+        for child in self.dict_node.children.values():
+            yield _wrap_child(child)
 
     def resolve(self) -> _types.ConfigurationDict:
         """Resolve all values recursively, returning a ConfigurationDict."""
@@ -312,6 +333,8 @@ class _UnresolvedDict(_types.UnresolvedDict):
 class _UnresolvedList(_types.UnresolvedList):
     """Implements UnresolvedList using a _ListNode as the backing data structure."""
 
+    __slots__ = ("list_node",)
+
     def __init__(self, list_node: _ListNode):
         self.list_node = list_node
 
@@ -331,24 +354,15 @@ class _UnresolvedList(_types.UnresolvedList):
         if ix not in range(len(self)):
             raise IndexError(ix)
 
-        child = self.list_node.children[ix]
-
-        if isinstance(child, _FunctionCallNode):
-            # evaluate the function to turn it into a Dict, List, or Value node
-            child = child.evaluate()
-
-        if isinstance(child, _DictNode):
-            return _UnresolvedDict(child)
-        elif isinstance(child, _ListNode):
-            return _UnresolvedList(child)
-        elif isinstance(child, _ValueNode):
-            return child.resolve()
-        else:
-            raise TypeError(f"Unexpected node type: {type(child)}")  # pragma: no cover
+        return _wrap_child(self.list_node.children[ix])
 
-    def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+    def __iter__(
+        self,
+    ) -> Iterator[_UnresolvedDict | _UnresolvedList | _types.Configuration]:
+        # walk the children directly rather than through __getitem__, which would
+        # bounds-check every index
+        for child in self.list_node.children:
+            yield _wrap_child(child)
 
     def __len__(self):
         return len(self.list_node.children)
@@ -368,6 +382,8 @@ class _UnresolvedList(_types.UnresolvedList):
 class _UnresolvedFunctionCall(_types.UnresolvedFunctionCall):
     """Implements UnresolvedFunctionCall using _FunctionCallNode."""
 
+    __slots__ = ("function_node",)
+
     def __init__(self, function_node: _FunctionCallNode):
         self.function_node = function_node
 
@@ -416,6 +432,19 @@ def _make_unresolved_container(
     raise TypeError(f"Cannot create unresolved container for {type(node).__name__}.")
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_keypath(keypath: str) -> _types.KeyPath:
+    """Split a dotted keypath string into its components.
+
+    The same keypaths tend to be looked up repeatedly during resolution (for instance,
+    by every evaluation of a function that references another part of the
+    configuration), so the result is cached. The components are interned, since they
+    are used as dictionary keys at every level of the tree.
+
+    """
+    return tuple(map(sys.intern, keypath.split(".")))
+
+
 def _get_node_at_keypath(
     node: _DictNode | _ListNode,
     keypath: _types.KeyPath | str,
@@ -429,7 +458,7 @@ def _get_node_at_keypath(
 
     """
     if isinstance(keypath, str):
-        keypath = tuple(keypath.split("."))
+        keypath = _parse_keypath(keypath)
 
     head_key, *rest = keypath
 
@@ -501,20 +530,20 @@ class _Node(abc.ABC):
         else:
             self.local_variables = dict(local_variables)
 
-        # cache the root of the tree
-        self._root: _ConcreteNode | None = None
-
-    @property
+    @functools.cached_property
     def root(self) -> _ConcreteNode:
-        """The root of the configuration tree."""
+        """The root of the configuration tree.
+
+        This is computed on first access and then stored on the instance, so later
+        accesses are a plain attribute lookup.
+
+        """
         assert isinstance(self, (_DictNode, _ListNode, _ValueNode, _FunctionCallNode))
-        if self._root is None:
-            if self.parent is None:
-                self._root = self
-            else:
-                # recurse up the tree
-                self._root = self.parent.root
-        return self._root
+        if self.parent is None:
+            return self
+        else:
+            # recurse up the tree
+            return self.parent.root
 
     @abc.abstractmethod
     def resolve(self) -> _types.Configuration:
@@ -1409,6 +1438,19 @@ class _FunctionCallNode(_Node):
 # make_node() ==========================================================================
 
 
+# defined at module level rather than inside make_node(), which is called for every
+# node in the tree and would otherwise create a new class on each call
+class _CommonKwargs(TypedDict):
+    """Common keyword arguments passed to node constructors in make_node."""
+
+    resolution_context: _types.ResolutionContext
+    parent: _ConcreteNode | None
+    keypath: _types.KeyPath
+    local_variables: Mapping[str, _types.Configuration] | None
+    schema: _types.Schema
+    mode: ResolutionMode
+
+
 def make_node(
     cfg: _types.Configuration,
     schema: _types.Schema | _types.DynamicSchema,
@@ -1460,16 +1502,6 @@ def make_node(
         schema = schema(cfg, keypath)
         _validate_schema(schema)
 
-    class _CommonKwargs(TypedDict):
-        """Common keyword arguments passed to node constructors in make_node."""
-
-        resolution_context: _types.ResolutionContext
-        parent: _ConcreteNode | None
-        keypath: _types.KeyPath
-        local_variables: Mapping[str, _types.Configuration] | None
-        schema: _types.Schema
-        mode: ResolutionMode
-
     common_kwargs: _CommonKwargs = {
         "resolution_context": resolution_context,
         "parent": parent,
@@ -72,21 +72,19 @@ def _check_for_dunder_function_call(
 
     """
 
-    def _is_dunder(s: str) -> bool:
-        """Checks if a string is of the form "__<something>__"."""
-        return s.startswith("__") and s.endswith("__")
-
-    is_potential_function_call = any(_is_dunder(key) for key in dct.keys())
-
-    if is_potential_function_call:
-        if len(dct) != 1:
-            raise ValueError("Invalid function call.")
-        else:
-            key = next(iter(dct.keys()))
-            function_name = key[2:-2]
+    # this runs on every dictionary in the configuration, so the scan for a key of the
+    # form "__<something>__" is a plain loop rather than any() over a generator
+    for key in dct:
+        if key.startswith("__") and key.endswith("__"):
+            break
     else:
         return None
 
+    if len(dct) != 1:
+        raise ValueError("Invalid function call.")
+
+    function_name = key[2:-2]
+
     if function_name not in functions:
         raise ValueError(f"Unknown function: {function_name}")
 
@@ -97,7 +95,9 @@ def _check_for_dunder_function_call(
 
 
 def _is_leaf(x: _types.Configuration) -> bool:
-    return not isinstance(x, dict) and not isinstance(x, list)
+    # x is resolved output, whose containers are always plain dicts and lists built by
+    # the resolver, so exact type checks suffice and are cheaper than isinstance
+    return type(x) is not dict and type(x) is not list
 
 
 def _copy_into(dst, src):
@@ -1,6 +1,12 @@
 """Shared internal utilities."""
 
-from copy import deepcopy
+import typing
+
+from .exceptions import ResolutionError
+from .types import KeyPath
+
+# plural names of the element types accepted by require_list_of() and list_of_error()
+_PLURAL_TYPE_NAMES: dict[type, str] = {dict: "dictionaries", list: "lists"}
 
 
 def deep_update(dictionaries: list[dict]) -> dict:
@@ -8,7 +14,8 @@ def deep_update(dictionaries: list[dict]) -> dict:
 
     Later dictionaries override earlier ones. When both sides of a key are
     dicts the merge recurses; otherwise the later value wins. The input
-    dictionaries are not mutated.
+    dictionaries are not mutated, but values that are not merged are shared with the
+    result rather than copied.
 
     Parameters
     ----------
@@ -29,12 +36,113 @@ def deep_update(dictionaries: list[dict]) -> dict:
     {'a': {'x': 1, 'y': 3}}
 
     """
-    first = deepcopy(dictionaries[0])
-    for dct in dictionaries[1:]:
-        for key, value in dct.items():
-            if isinstance(value, dict) and isinstance(first.get(key), dict):
-                first[key] = deep_update([first[key], value])
+    result: dict = {}
+    for dct in dictionaries:
+        deep_update_into(result, dct)
+
+    return result
+
+
+def deep_update_into(target: dict, source: dict) -> None:
+    """Merge ``source`` into ``target``, in place.
+
+    This is the step that :func:`deep_update` applies to each of its inputs, for
+    callers that validate their dictionaries while merging them.
+
+    Only ``target`` itself is modified. When a nested dictionary in ``target`` needs to
+    be merged, it is replaced by a new dictionary rather than modified, so nested
+    values shared with ``source`` or earlier sources are never mutated.
+
+    Nested merges are driven by an explicit stack rather than recursion, so deeply
+    nested configurations cannot hit the recursion limit. The pairs on the stack have
+    disjoint targets, so the order in which they are merged does not matter.
+
+    """
+    stack = [(target, source)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            existing = target.get(key)
+            if isinstance(value, dict) and isinstance(existing, dict):
+                merged = target[key] = dict(existing)
+                stack.append((merged, value))
             else:
-                first[key] = value
+                target[key] = value
+
+
+def require_list_of[T](
+    value: object, type_: type[T], function_name: str, keypath: KeyPath
+) -> list[T]:
+    """Check that a function's input is a non-empty list of ``type_`` instances.
 
-    return first
+    Types are compared exactly (``type(x) is list``) rather than with ``isinstance``.
+    This is intended for the resolved input of functions, whose containers are always
+    plain dicts and lists built by the resolver.
+
+    Parameters
+    ----------
+    value
+        The input to check.
+    type_
+        The required type of every element; either ``dict`` or ``list``.
+    function_name
+        The name of the function, used in error messages.
+    keypath
+        The keypath of the function call, used in error messages.
+
+    Returns
+    -------
+    list
+        ``value`` itself, narrowed to a list of ``type_``.
+
+    Raises
+    ------
+    ResolutionError
+        If ``value`` is not a list, contains an element of the wrong type, or is empty.
+
+    """
+    if type(value) is not list:
+        raise list_of_error(type_, function_name, keypath)
+
+    for element in value:
+        if type(element) is not type_:
+            raise list_of_error(type_, function_name, keypath)
+
+    if not value:
+        raise list_of_error(type_, function_name, keypath, empty=True)
+
+    return typing.cast(list[T], value)
+
+
+def list_of_error(
+    type_: type, function_name: str, keypath: KeyPath, *, empty: bool = False
+) -> ResolutionError:
+    """Build the error raised when a function's input is not a list of ``type_``.
+
+    Functions that validate their input while consuming it, rather than up front with
+    :func:`require_list_of`, use this to raise the same errors.
+
+    Parameters
+    ----------
+    type_
+        The required type of every element; either ``dict`` or ``list``.
+    function_name
+        The name of the function, used in the message.
+    keypath
+        The keypath of the function call.
+    empty
+        If True, the error is for an empty list rather than a wrong type.
+
+    Returns
+    -------
+    ResolutionError
+
+    """
+    noun = _PLURAL_TYPE_NAMES[type_]
+    if empty:
+        return ResolutionError(
+            f"Input to '{function_name}' must be a non-empty list of {noun}.", keypath
+        )
+    return ResolutionError(
+        f"Input to '{function_name}' must be a list of {noun}.", keypath
+    )
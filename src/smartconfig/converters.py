@@ -153,10 +153,13 @@ def boolean(value: bool | str) -> bool:
 
 # dates / datetimes ====================================================================
 
+# a time of day (HH:MM) anywhere in a string
+_TIME_COMPONENT_RE = re.compile(r"\d{2}:\d{2}")
+
 
 def _contains_time_component(s: str) -> bool:
     """Check if a string contains a time pattern (HH:MM)."""
-    return bool(re.search(r"\d{2}:\d{2}", s))
+    return _TIME_COMPONENT_RE.search(s) is not None
 
 
 def date(value: str | datetimelib.date | datetimelib.datetime) -> datetimelib.date:
@@ -1,7 +1,7 @@
 """Datetime-related functions: at, offset, first, and parse."""
 
 import datetime as datetimelib
-import enum
+import functools
 import re
 from collections.abc import Callable
 
@@ -12,7 +12,42 @@ from ..exceptions import ResolutionError
 # helpers ==============================================================================
 
 # valid units for offsets
-_VALID_TIMEDELTA_UNITS = {"weeks", "days", "hours", "minutes", "seconds"}
+_VALID_TIMEDELTA_UNITS = frozenset({"weeks", "days", "hours", "minutes", "seconds"})
+
+# the valid units as listed in error messages
+_VALID_TIMEDELTA_UNITS_STR = ", ".join(sorted(_VALID_TIMEDELTA_UNITS))
+
+# compiled patterns used by the parsers below
+_OFFSET_PART_RE = re.compile(r"^(\d+)\s+(week|day|hour|minute|second)s?$")
+_TIME_SUFFIX_RE = re.compile(r" at (\d{2}):(\d{2}):(\d{2})$", re.IGNORECASE)
+_FIRST_WEEKDAY_RE = re.compile(
+    r"^first\s+(.+?)\s+(after|before)\s+(.+)$", re.IGNORECASE
+)
+_OFFSET_RE = re.compile(r"^(.+?)\s+(after|before)\s+(.+)$", re.IGNORECASE)
+
+# translation table used to normalize the separators in a list of weekday names
+_COMMA_TO_SPACE = str.maketrans({",": " "})
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_iso_string(s: str) -> datetimelib.datetime | None:
+    """Parse an ISO date or datetime string, or return None if it is not one.
+
+    The same reference dates tend to appear throughout a configuration, so results
+    are cached.
+
+    Examples
+    --------
+    >>> _parse_iso_string("2021-10-05")
+    datetime.datetime(2021, 10, 5, 0, 0)
+    >>> _parse_iso_string("not a date") is None
+    True
+
+    """
+    try:
+        return datetimelib.datetime.fromisoformat(s)
+    except ValueError:
+        return None
 
 
 def _read_datetime(value: Configuration, keypath: KeyPath) -> datetimelib.datetime:
@@ -51,10 +86,10 @@ def _read_datetime(value: Configuration, keypath: KeyPath) -> datetimelib.dateti
     if isinstance(value, datetimelib.date):
         return datetimelib.datetime.combine(value, datetimelib.time())
     if isinstance(value, str):
-        try:
-            return datetimelib.datetime.fromisoformat(value)
-        except ValueError:
+        result = _parse_iso_string(value)
+        if result is None:
             raise ResolutionError(f"Invalid date: '{value}'.", keypath)
+        return result
     raise ResolutionError(
         f"Invalid date: expected a string or date/datetime object, "
         f"got {type(value).__name__}.",
@@ -93,11 +128,11 @@ def _read_offset(value: Configuration, keypath: KeyPath) -> datetimelib.timedelt
 
     """
     if isinstance(value, dict):
-        unknown = set(value.keys()) - _VALID_TIMEDELTA_UNITS
+        unknown = [k for k in value if k not in _VALID_TIMEDELTA_UNITS]
         if unknown:
             raise ResolutionError(
                 f"Unknown unit(s) in 'by': {', '.join(sorted(unknown))}. "
-                f"Valid units are: {', '.join(sorted(_VALID_TIMEDELTA_UNITS))}.",
+                f"Valid units are: {_VALID_TIMEDELTA_UNITS_STR}.",
                 keypath,
             )
         units: dict[str, int] = {}
@@ -112,33 +147,55 @@ def _read_offset(value: Configuration, keypath: KeyPath) -> datetimelib.timedelt
         return datetimelib.timedelta(**units)
 
     if isinstance(value, str):
-        kwargs: dict[str, int] = {}
-        parts = [p.strip() for p in value.split(",")]
-        for part in parts:
-            match = re.match(r"^(\d+)\s+(week|day|hour|minute|second)s?$", part)
-            if not match:
-                raise ResolutionError(f"Cannot parse offset: '{value}'.", keypath)
-            amount, unit = match.groups()
-            kwargs[unit + "s"] = int(amount)
-        return datetimelib.timedelta(**kwargs)
+        delta = _parse_offset_string(value)
+        if delta is None:
+            raise ResolutionError(f"Cannot parse offset: '{value}'.", keypath)
+        return delta
 
     raise ResolutionError(
         f"'by' must be a string or dictionary, got {type(value).__name__}.", keypath
     )
 
 
-class _DaysOfTheWeek(enum.IntEnum):
-    MONDAY = 0
-    TUESDAY = 1
-    WEDNESDAY = 2
-    THURSDAY = 3
-    FRIDAY = 4
-    SATURDAY = 5
-    SUNDAY = 6
+@functools.lru_cache(maxsize=256)
+def _parse_offset_string(s: str) -> datetimelib.timedelta | None:
+    """Parse an offset string such as ``"1 week, 2 days"`` into a timedelta.
+
+    Returns None if the string cannot be parsed. The same few offset strings tend to
+    be used throughout a configuration, so results are cached.
+
+    Examples
+    --------
+    >>> _parse_offset_string("1 week, 2 days")
+    datetime.timedelta(days=9)
+    >>> _parse_offset_string("1 fortnight") is None
+    True
 
+    """
+    kwargs: dict[str, int] = {}
+    for part in s.split(","):
+        match = _OFFSET_PART_RE.match(part.strip())
+        if not match:
+            return None
+        amount, unit = match.groups()
+        kwargs[unit + "s"] = int(amount)
+    return datetimelib.timedelta(**kwargs)
+
+
+# lowercase day names mapped to their ``datetime.weekday()`` numbers
+_DAY_NAMES: dict[str, int] = {
+    "monday": 0,
+    "tuesday": 1,
+    "wednesday": 2,
+    "thursday": 3,
+    "friday": 4,
+    "saturday": 5,
+    "sunday": 6,
+}
 
-def _get_day_of_the_week(s: Configuration, keypath: KeyPath) -> _DaysOfTheWeek:
-    """Convert a day name string to a ``_DaysOfTheWeek`` value.
+
+def _get_day_of_the_week(s: Configuration, keypath: KeyPath) -> int:
+    """Convert a day name string to its weekday number (Monday is 0).
 
     Parameters
     ----------
@@ -149,7 +206,7 @@ def _get_day_of_the_week(s: Configuration, keypath: KeyPath) -> _DaysOfTheWeek:
 
     Returns
     -------
-    _DaysOfTheWeek
+    int
 
     Raises
     ------
@@ -159,9 +216,9 @@ def _get_day_of_the_week(s: Configuration, keypath: KeyPath) -> _DaysOfTheWeek:
     Examples
     --------
     >>> _get_day_of_the_week("Monday", keypath=())
-    <_DaysOfTheWeek.MONDAY: 0>
+    0
     >>> _get_day_of_the_week("friday", keypath=())
-    <_DaysOfTheWeek.FRIDAY: 4>
+    4
 
     """
     if not isinstance(s, str):
@@ -169,13 +226,13 @@ def _get_day_of_the_week(s: Configuration, keypath: KeyPath) -> _DaysOfTheWeek:
             f"Expected a day name string, got {type(s).__name__}.", keypath
         )
     try:
-        return _DaysOfTheWeek[s.upper()]
+        return _DAY_NAMES[s.lower()]
     except KeyError:
         raise ResolutionError(f"Invalid day of week: '{s}'.", keypath)
 
 
-def _parse_weekdays(raw: str, keypath: KeyPath) -> set[_DaysOfTheWeek]:
-    """Parse a string of weekday names into a set of ``_DaysOfTheWeek`` values.
+def _parse_weekdays(raw: str, keypath: KeyPath) -> set[int]:
+    """Parse a string of weekday names into a set of weekday numbers.
 
     Names may be separated by commas, spaces, or the word ``"or"``.
     All separators are normalized before splitting, so ``"monday, friday"``,
@@ -190,21 +247,26 @@ def _parse_weekdays(raw: str, keypath: KeyPath) -> set[_DaysOfTheWeek]:
 
     Returns
     -------
-    set of _DaysOfTheWeek
+    set of int
 
     Raises
     ------
     ResolutionError
-        If any name in the string is not a valid day name.
+        If any name in the string is not a valid day name, or if the string names
+        no days at all.
 
     Examples
     --------
     >>> _parse_weekdays("monday, friday", keypath=())
-    {_DaysOfTheWeek.MONDAY, _DaysOfTheWeek.FRIDAY}
+    {0, 4}
 
     """
-    normalized = raw.replace(",", " ").replace(" or ", " ")
+    normalized = raw.translate(_COMMA_TO_SPACE)
+    if " or " in normalized:
+        normalized = normalized.replace(" or ", " ")
     parts = normalized.split()
+    if not parts:
+        raise ResolutionError("At least one weekday is required.", keypath)
     return {_get_day_of_the_week(p, keypath) for p in parts}
 
 
@@ -233,8 +295,11 @@ def _parse_and_remove_time(
     ('2021-10-05', None)
 
     """
-    time_pattern = r" at (\d{2}):(\d{2}):(\d{2})$"
-    match = re.search(time_pattern, s, flags=re.IGNORECASE)
+    # the suffix has a fixed width, so most strings can be ruled out without a search
+    if s[-12:-8].lower() != " at ":
+        return s, None
+
+    match = _TIME_SUFFIX_RE.search(s)
 
     if match:
         hours, minutes, seconds = [int(x) for x in match.groups()]
@@ -242,20 +307,28 @@ def _parse_and_remove_time(
             time = datetimelib.time(hours, minutes, seconds)
         except ValueError:
             raise ResolutionError(f"Invalid time in '{s}'.", keypath)
-        s = re.sub(time_pattern, "", s, flags=re.IGNORECASE)
+        s = s[: match.start()]
     else:
         time = None
 
     return s, time
 
 
+# single-day steps used when stepping past skipped dates
+_ONE_DAY = datetimelib.timedelta(days=1)
+_MINUS_ONE_DAY = datetimelib.timedelta(days=-1)
+
 # Maximum number of skip attempts before giving up. Set to 366 to guarantee
 # that at least one full year of candidates is tried.
 _MAX_SKIP_RETRIES = 366
 
 
-def _read_skip_dates(value: Configuration, keypath: KeyPath) -> set[datetimelib.date]:
-    """Read a ``skip`` list into a set of ``datetime.date`` objects.
+def _read_skip_dates(value: Configuration, keypath: KeyPath) -> set[int]:
+    """Read a ``skip`` list into a set of date ordinals.
+
+    Dates are represented by their proleptic Gregorian ordinals (see
+    ``datetime.date.toordinal``), which are cheaper to hash and compare than
+    ``date`` objects.
 
     Parameters
     ----------
@@ -268,7 +341,7 @@ def _read_skip_dates(value: Configuration, keypath: KeyPath) -> set[datetimelib.
 
     Returns
     -------
-    set of datetime.date
+    set of int
 
     Raises
     ------
@@ -278,17 +351,17 @@ def _read_skip_dates(value: Configuration, keypath: KeyPath) -> set[datetimelib.
     Examples
     --------
     >>> _read_skip_dates(["2021-10-05", "2021-10-06"], keypath=())
-    {datetime.date(2021, 10, 5), datetime.date(2021, 10, 6)}
+    {738068, 738069}
 
     """
     if not isinstance(value, list):
         raise ResolutionError("'skip' must be a list of dates.", keypath)
-    return {_read_datetime(item, keypath).date() for item in value}
+    return {_read_datetime(item, keypath).toordinal() for item in value}
 
 
 def _find_first_weekday(
     reference: datetimelib.datetime,
-    weekdays: set[_DaysOfTheWeek],
+    weekdays: set[int],
     before: bool,
 ) -> datetimelib.datetime:
     """Find the first occurrence of a weekday before/after a reference date.
@@ -297,8 +370,9 @@ def _find_first_weekday(
     ----------
     reference : datetime.datetime
         The starting point. This date is excluded from the search.
-    weekdays : set of _DaysOfTheWeek
-        The target weekday(s) to search for.
+    weekdays : set of int
+        The target weekday number(s) to search for, as returned by
+        ``datetime.weekday()``.
     before : bool
         If True, search backward in time; otherwise search forward.
 
@@ -310,21 +384,24 @@ def _find_first_weekday(
 
     Examples
     --------
-    >>> _find_first_weekday(datetime(2021, 9, 14), {MONDAY}, before=False)
+    >>> _find_first_weekday(datetime(2021, 9, 14), {0}, before=False)
     datetime(2021, 9, 20)  # first Monday after Sep 14 (a Tuesday)
 
     """
-    sign = -1 if before else 1
-    delta = datetimelib.timedelta(days=sign)
-    cursor = reference + delta
-    while cursor.weekday() not in weekdays:
-        cursor += delta
-    return cursor
+    # the distance to each weekday is computed directly; a distance of 0 means the
+    # reference date itself, which is excluded, so the next match is a week away
+    reference_weekday = reference.weekday()
+    if before:
+        days = min((reference_weekday - w) % 7 or 7 for w in weekdays)
+        return reference - datetimelib.timedelta(days=days)
+    else:
+        days = min((w - reference_weekday) % 7 or 7 for w in weekdays)
+        return reference + datetimelib.timedelta(days=days)
 
 
 def _skip_excluded(
     result: datetimelib.datetime,
-    skip_dates: set[datetimelib.date],
+    skip_dates: set[int],
     next_candidate: Callable[[datetimelib.datetime], datetimelib.datetime],
     keypath: KeyPath,
 ) -> datetimelib.datetime:
@@ -334,8 +411,8 @@ def _skip_excluded(
     ----------
     result : datetime.datetime
         The initial candidate date.
-    skip_dates : set of datetime.date
-        Dates to skip.
+    skip_dates : set of int
+        Ordinals of the dates to skip, as returned by ``_read_skip_dates``.
     next_candidate : callable
         A function ``(datetime) -> datetime`` that produces the next candidate
         when the current one is excluded.
@@ -353,15 +430,18 @@ def _skip_excluded(
 
     Examples
     --------
-    >>> skip = {datetimelib.date(2021, 10, 6)}
+    >>> skip = {datetimelib.date(2021, 10, 6).toordinal()}
     >>> candidate = datetimelib.datetime(2021, 10, 6)
     >>> step = lambda dt: dt + datetimelib.timedelta(days=1)
     >>> _skip_excluded(candidate, skip, step, keypath=())
     datetime.datetime(2021, 10, 7, 0, 0)
 
     """
+    if not skip_dates:
+        return result
+
     retries = 0
-    while result.date() in skip_dates:
+    while result.toordinal() in skip_dates:
         result = next_candidate(result)
         retries += 1
         if retries > _MAX_SKIP_RETRIES:
@@ -444,7 +524,7 @@ def offset(args: FunctionArgs) -> datetimelib.datetime:
     if "by" not in args.input:
         raise ResolutionError("Input to 'offset' must contain 'by'.", args.keypath)
 
-    skip_dates: set[datetimelib.date] = set()
+    skip_dates: set[int] = set()
     if "skip" in args.input:
         skip_dates = _read_skip_dates(args.input["skip"], args.keypath)
 
@@ -455,8 +535,7 @@ def offset(args: FunctionArgs) -> datetimelib.datetime:
     result = reference - delta if has_before else reference + delta
 
     if skip_dates:
-        sign = -1 if has_before else 1
-        day_step = datetimelib.timedelta(days=sign)
+        day_step = _MINUS_ONE_DAY if has_before else _ONE_DAY
         result = _skip_excluded(
             result,
             skip_dates,
@@ -510,7 +589,10 @@ def first(args: FunctionArgs) -> datetimelib.datetime:
             "The 'weekday' key must be a string or list of strings.", args.keypath
         )
 
-    skip_dates: set[datetimelib.date] = set()
+    if not weekdays:
+        raise ResolutionError("At least one weekday is required.", args.keypath)
+
+    skip_dates: set[int] = set()
     if "skip" in args.input:
         skip_dates = _read_skip_dates(args.input["skip"], args.keypath)
 
@@ -533,20 +615,15 @@ def first(args: FunctionArgs) -> datetimelib.datetime:
 # parse --------------------------------------------------------------------------------
 
 
-class _ParseError(Exception):
-    """Raised when a parse attempt fails because the string does not match.
+# each _try_* parser returns None if the string is not of its form, so that parse()
+# can try them one after another until one succeeds
 
-    Used for control flow: parsers are tried one after another until one
-    succeeds.
 
-    """
-
-
-def _try_parse_first_weekday(s: str, keypath: KeyPath) -> datetimelib.datetime:
+def _try_parse_first_weekday(s: str, keypath: KeyPath) -> datetimelib.datetime | None:
     """Try to parse ``s`` as ``"first <weekdays> after|before <reference>"``."""
-    match = re.match(r"^first\s+(.+?)\s+(after|before)\s+(.+)$", s, flags=re.IGNORECASE)
+    match = _FIRST_WEEKDAY_RE.match(s)
     if not match:
-        raise _ParseError
+        return None
 
     weekday_raw, direction, reference_raw = match.groups()
     weekdays = _parse_weekdays(weekday_raw, keypath)
@@ -556,11 +633,11 @@ def _try_parse_first_weekday(s: str, keypath: KeyPath) -> datetimelib.datetime:
     )
 
 
-def _try_read_offset(s: str, keypath: KeyPath) -> datetimelib.datetime:
+def _try_read_offset(s: str, keypath: KeyPath) -> datetimelib.datetime | None:
     """Try to parse ``s`` as ``"<offset> after|before <reference>"``."""
-    match = re.match(r"^(.+?)\s+(after|before)\s+(.+)$", s, flags=re.IGNORECASE)
+    match = _OFFSET_RE.match(s)
     if not match:
-        raise _ParseError
+        return None
 
     offset_raw, direction, reference_raw = match.groups()
     delta = _read_offset(offset_raw.strip(), keypath)
@@ -572,12 +649,44 @@ def _try_read_offset(s: str, keypath: KeyPath) -> datetimelib.datetime:
         return reference + delta
 
 
-def _try_parse_iso(s: str, keypath: KeyPath) -> datetimelib.datetime:
+def _try_parse_iso(s: str, keypath: KeyPath) -> datetimelib.datetime | None:
     """Try to parse ``s`` as a plain ISO date or datetime."""
-    try:
-        return datetimelib.datetime.fromisoformat(s.strip())
-    except ValueError:
-        raise _ParseError
+    return _parse_iso_string(s.strip())
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_string(raw: str) -> datetimelib.datetime:
+    """Parse a date string for ``parse``, caching the result.
+
+    The keypath is deliberately not an argument so that the same string appearing at
+    different keypaths shares one cache entry. Errors are raised with an empty keypath;
+    ``parse`` re-raises them with the real one. Datetimes are immutable, so sharing
+    cached results is safe.
+
+    """
+    s, time_override = _parse_and_remove_time(raw, ())
+
+    # cheap necessary conditions for each form, so that strings which cannot match
+    # a parser (e.g., plain ISO dates) skip its regex entirely
+    lowered = s.lower()
+    parsers: list[Callable[[str, KeyPath], datetimelib.datetime | None]] = []
+    if lowered.startswith("first"):
+        parsers.append(_try_parse_first_weekday)
+    if "after" in lowered or "before" in lowered:
+        parsers.append(_try_read_offset)
+    parsers.append(_try_parse_iso)
+
+    for try_parse in parsers:
+        result = try_parse(s, ())
+        if result is not None:
+            break
+    else:
+        raise ResolutionError(f"Cannot parse date: '{raw}'.", ())
+
+    if time_override is not None:
+        result = datetimelib.datetime.combine(result, time_override)
+
+    return result
 
 
 def parse(args: FunctionArgs) -> datetimelib.datetime:
@@ -596,22 +705,10 @@ def parse(args: FunctionArgs) -> datetimelib.datetime:
     if not isinstance(args.input, str):
         raise ResolutionError("Input to 'parse' must be a string.", args.keypath)
 
-    s, time_override = _parse_and_remove_time(args.input, args.keypath)
-
-    parsers = [_try_parse_first_weekday, _try_read_offset, _try_parse_iso]
-    for try_parse in parsers:
-        try:
-            result = try_parse(s, args.keypath)
-            break
-        except _ParseError:
-            continue
-    else:
-        raise ResolutionError(f"Cannot parse date: '{args.input}'.", args.keypath)
-
-    if time_override is not None:
-        result = datetimelib.datetime.combine(result, time_override)
-
-    return result
+    try:
+        return _parse_string(args.input)
+    except ResolutionError as exc:
+        raise ResolutionError(exc.reason, args.keypath) from None
 
 
 DATETIME_FUNCTIONS: FunctionMapping = {
@@ -1,6 +1,5 @@
 """Dictionary-related functions: update, update_shallow, and from_items."""
 
-from copy import deepcopy
 import typing
 
 from ..types import (
@@ -10,15 +9,7 @@ from ..types import (
     ConfigurationDict,
 )
 from ..exceptions import ResolutionError
-from .._utils import deep_update
-
-
-# helpers ==============================================================================
-
-
-def _all_elements_are_instances_of(container, type_):
-    """Check if all elements in the container are instances of the given type."""
-    return all(isinstance(element, type_) for element in container)
+from .._utils import deep_update_into, list_of_error
 
 
 # functions ============================================================================
@@ -30,27 +21,21 @@ def update_shallow(args: FunctionArgs) -> ConfigurationDict:
     ``args.input`` should be a list of dictionaries.
 
     """
-    if not isinstance(args.input, list) or not _all_elements_are_instances_of(
-        args.input, dict
-    ):
-        raise ResolutionError(
-            "Input to 'update_shallow' must be a list of dictionaries.", args.keypath
-        )
-
-    if len(args.input) == 0:
-        raise ResolutionError(
-            "Input to 'update_shallow' must be a non-empty list of dictionaries.",
-            args.keypath,
-        )
+    if type(args.input) is not list:
+        raise list_of_error(dict, "update_shallow", args.keypath)
 
-    # true since we checked _all_elements_are_instances_of(args.input, dict) above
-    input = typing.cast(list[ConfigurationDict], args.input)
+    if not args.input:
+        raise list_of_error(dict, "update_shallow", args.keypath, empty=True)
 
-    first = deepcopy(input[0])
-    for dct in input[1:]:
-        first.update(dct)
+    # validate each element as it is merged, rather than in a separate pass. nested
+    # values are shared with the input rather than copied
+    result: ConfigurationDict = {}
+    for dct in args.input:
+        if type(dct) is not dict:
+            raise list_of_error(dict, "update_shallow", args.keypath)
+        result |= dct
 
-    return first
+    return result
 
 
 def update(args: FunctionArgs) -> ConfigurationDict:
@@ -59,22 +44,20 @@ def update(args: FunctionArgs) -> ConfigurationDict:
     ``args.input`` should be a list of dictionaries.
 
     """
-    if not isinstance(args.input, list) or not _all_elements_are_instances_of(
-        args.input, dict
-    ):
-        raise ResolutionError(
-            "Input to 'update' must be a list of dictionaries.", args.keypath
-        )
+    if type(args.input) is not list:
+        raise list_of_error(dict, "update", args.keypath)
 
-    if len(args.input) == 0:
-        raise ResolutionError(
-            "Input to 'update' must be a non-empty list of dictionaries.", args.keypath
-        )
+    if not args.input:
+        raise list_of_error(dict, "update", args.keypath, empty=True)
 
-    # true since we checked _all_elements_are_instances_of(args.input, dict) above
-    input = typing.cast(list[dict], args.input)
+    # validate each element as it is merged, rather than in a separate pass
+    result: ConfigurationDict = {}
+    for dct in args.input:
+        if type(dct) is not dict:
+            raise list_of_error(dict, "update", args.keypath)
+        deep_update_into(result, dct)
 
-    return deep_update(input)
+    return result
 
 
 @Function.new(resolve_input=False)
@@ -83,7 +66,7 @@ def from_items(args: FunctionArgs) -> ConfigurationDict:
 
     ``args.input`` should be a list of dictionaries with two keys:
 
-        - ``key``: the key of the dictionary
+        - ``key``: the key of the dictionary; must resolve to a string
         - ``value``: the value of the dictionary
 
     """
@@ -98,14 +81,18 @@ def from_items(args: FunctionArgs) -> ConfigurationDict:
         },
     )
 
-    assert isinstance(input_, list)
-
-    dct = {}
+    # true since the schema above guarantees a list of dicts with "key" and "value"
+    items = typing.cast(list[dict[str, typing.Any]], input_)
 
-    for item in input_:
-        assert isinstance(item, dict)
+    # keys are checked in the same pass that builds the result
+    dct: ConfigurationDict = {}
+    for item in items:
         key = item["key"]
-        assert isinstance(key, str)
+        if not isinstance(key, str):
+            raise ResolutionError(
+                f"Keys in 'from_items' must be strings, but got {type(key).__name__}.",
+                args.keypath,
+            )
         dct[key] = item["value"]
 
     return dct
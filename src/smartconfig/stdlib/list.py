@@ -1,6 +1,5 @@
 """List-related functions: concatenate, zip, range, loop, and filter."""
 
-import itertools
 import typing
 
 from ..types import (
@@ -9,16 +8,22 @@ from ..types import (
     FunctionMapping,
     ConfigurationList,
     Configuration,
+    Schema,
 )
 from ..exceptions import ResolutionError
+from .._utils import list_of_error, require_list_of
 
 
 # helpers ==============================================================================
 
+# the schema used to resolve the condition of 'filter' for each element
+_BOOLEAN_SCHEMA: Schema = {"type": "boolean"}
 
-def _all_elements_are_instances_of(container, type_):
-    """Check if all elements in the container are instances of the given type."""
-    return all(isinstance(element, type_) for element in container)
+# the keys allowed in the input to 'range'
+_RANGE_KEYS = frozenset({"start", "stop", "step"})
+
+# the schema used to resolve the list that 'loop' and 'filter' iterate over
+_ANY_LIST_SCHEMA: Schema = {"type": "list", "element_schema": {"type": "any"}}
 
 
 # functions ============================================================================
@@ -30,22 +35,20 @@ def concatenate(args: FunctionArgs) -> ConfigurationList:
     ``args.input`` should be a list of lists.
 
     """
-    if not isinstance(args.input, list) or not _all_elements_are_instances_of(
-        args.input, list
-    ):
-        raise ResolutionError(
-            "Input to 'concatenate' must be a list of lists.", args.keypath
-        )
+    if type(args.input) is not list:
+        raise list_of_error(list, "concatenate", args.keypath)
 
-    if len(args.input) == 0:
-        raise ResolutionError(
-            "Input to 'concatenate' must be a non-empty list of lists.", args.keypath
-        )
+    if not args.input:
+        raise list_of_error(list, "concatenate", args.keypath, empty=True)
 
-    # true since we checked _all_elements_are_instances_of(args.input, list) above
-    input = typing.cast(list[list], args.input)
+    # validate each element as it is consumed, rather than in a separate pass
+    result: ConfigurationList = []
+    for lst in args.input:
+        if type(lst) is not list:
+            raise list_of_error(list, "concatenate", args.keypath)
+        result.extend(lst)
 
-    return list(itertools.chain(*input))
+    return result
 
 
 def zip_(args: FunctionArgs) -> ConfigurationList:
@@ -54,17 +57,15 @@ def zip_(args: FunctionArgs) -> ConfigurationList:
     ``args.input`` should be a list of lists.
 
     """
-    if not isinstance(args.input, list) or not _all_elements_are_instances_of(
-        args.input, list
-    ):
-        raise ResolutionError("Input to 'zip' must be a list of lists.", args.keypath)
+    input = require_list_of(args.input, list, "zip", args.keypath)
 
-    if len(args.input) == 0:
-        raise ResolutionError(
-            "Input to 'zip' must be a non-empty list of lists.", args.keypath
-        )
+    # the two-list case is by far the most common; unpacking pairs directly avoids
+    # building an intermediate tuple per entry
+    if len(input) == 2:
+        left, right = input
+        return [[a, b] for a, b in zip(left, right)]
 
-    return [list(entry) for entry in zip(*args.input)]
+    return list(map(list, zip(*input)))
 
 
 def range_(args: FunctionArgs) -> ConfigurationList:
@@ -77,7 +78,7 @@ def range_(args: FunctionArgs) -> ConfigurationList:
         - ``step``: the step between each element in the range. Defaults to 1.
 
     """
-    if not isinstance(args.input, dict):
+    if type(args.input) is not dict:
         raise ResolutionError("Input to 'range' must be a dictionary.", args.keypath)
 
     if "stop" not in args.input:
@@ -85,25 +86,23 @@ def range_(args: FunctionArgs) -> ConfigurationList:
             "Input to 'range' must be a dictionary with a key 'stop'.", args.keypath
         )
 
-    start = args.input.get("start", 0)
-    stop = args.input["stop"]
-    step = args.input.get("step", 1)
-
-    if set(args.input.keys()) - {"start", "stop", "step"}:
+    if not args.input.keys() <= _RANGE_KEYS:
         raise ResolutionError(
             "Input to 'range' must be a dictionary with keys 'start', 'stop' and 'step'.",
             args.keypath,
         )
 
-    if (
-        not isinstance(start, int)
-        or not isinstance(stop, int)
-        or not isinstance(step, int)
-    ):
-        raise ResolutionError(
-            "The values of 'start', 'stop' and 'step' in 'range' must be integers.",
-            args.keypath,
-        )
+    # only the values that were given need checking; the defaults are integers
+    for value in args.input.values():
+        if not isinstance(value, int):
+            raise ResolutionError(
+                "The values of 'start', 'stop' and 'step' in 'range' must be integers.",
+                args.keypath,
+            )
+
+    start = typing.cast(int, args.input.get("start", 0))
+    stop = typing.cast(int, args.input["stop"])
+    step = typing.cast(int, args.input.get("step", 1))
 
     return list(range(start, stop, step))
 
@@ -133,22 +132,26 @@ def loop(args: FunctionArgs) -> Configuration:
             args.keypath,
         )
 
-    over = args.resolve(
-        args.input["over"], schema={"type": "list", "element_schema": {"type": "any"}}
-    )
+    over = args.resolve(args.input["over"], schema=_ANY_LIST_SCHEMA)
 
     element_schema = args.schema["element_schema"]
+    variable = args.input["variable"]
+    body = args.input["in"]
 
     assert isinstance(over, list)
-    assert isinstance(args.input["variable"], str)
+    assert isinstance(variable, str)
+
+    resolve = args.resolve
+
+    # the resolver copies the local variables into the nodes it builds, so a single
+    # dictionary can be reused across iterations
+    local_variables: dict[str, Configuration] = {}
 
     result = []
     for element in over:
-        local_variables = {args.input["variable"]: element}
+        local_variables[variable] = element
         result.append(
-            args.resolve(
-                args.input["in"], local_variables=local_variables, schema=element_schema
-            )
+            resolve(body, local_variables=local_variables, schema=element_schema)
         )
     return result
 
@@ -176,22 +179,27 @@ def filter_(args: FunctionArgs) -> ConfigurationList:
             args.keypath,
         )
 
-    iterable = args.resolve(
-        args.input["iterable"],
-        schema={"type": "list", "element_schema": {"type": "any"}},
-    )
+    iterable = args.resolve(args.input["iterable"], schema=_ANY_LIST_SCHEMA)
+
+    variable = args.input["variable"]
+    condition = args.input["condition"]
 
     assert isinstance(iterable, list)
-    assert isinstance(args.input["variable"], str)
+    assert isinstance(variable, str)
+
+    if not iterable:
+        return []
+
+    resolve = args.resolve
+
+    # the resolver copies the local variables into the nodes it builds, so a single
+    # dictionary can be reused across iterations
+    local_variables: dict[str, Configuration] = {}
 
     result = []
     for element in iterable:
-        local_variables = {args.input["variable"]: element}
-        if args.resolve(
-            args.input["condition"],
-            local_variables=local_variables,
-            schema={"type": "boolean"},
-        ):
+        local_variables[variable] = element
+        if resolve(condition, local_variables=local_variables, schema=_BOOLEAN_SCHEMA):
             result.append(element)
 
     return result
@@ -5,7 +5,9 @@ from typing import (
     Mapping,
     Any,
     Callable,
+    Collection,
     Iterable,
+    Iterator,
     Protocol,
 )
 import abc
@@ -40,6 +42,8 @@ class UnresolvedDict(abc.ABC):
 
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def __getitem__(self, key: str) -> UnresolvedDict | UnresolvedList | Configuration:
         """Get an item from the dictionary.
@@ -65,12 +69,18 @@ class UnresolvedDict(abc.ABC):
         """Get the number of items in the dictionary. Does not trigger resolution."""
 
     @abc.abstractmethod
-    def __iter__(self) -> Iterable[str]:
+    def __iter__(self) -> Iterator[str]:
         """Iterate over the keys of the dictionary. Does not trigger resolution."""
 
-    @abc.abstractmethod
-    def keys(self) -> Iterable[str]:
-        """Get the keys of the dictionary. Does not trigger resolution."""
+    def keys(self) -> Collection[str]:
+        """Get the keys of the dictionary. Does not trigger resolution.
+
+        By default, this returns a new list of the keys, so that the result can be
+        iterated more than once and supports ``len()`` and ``in``. Subclasses may
+        override it to return a view of their keys instead.
+
+        """
+        return list(self)
 
     @abc.abstractmethod
     def values(
@@ -103,6 +113,8 @@ class UnresolvedList(abc.ABC):
 
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def __getitem__(self, ix) -> UnresolvedDict | UnresolvedList | Configuration:
         """Get an item from the list.
@@ -124,7 +136,7 @@ class UnresolvedList(abc.ABC):
     @abc.abstractmethod
     def __iter__(
         self,
-    ) -> Iterable[UnresolvedDict | UnresolvedList | Configuration]:
+    ) -> Iterator[UnresolvedDict | UnresolvedList | Configuration]:
         """Iterate over the items in the list.
 
         This will trigger the resolution of leaf values and function nodes.
@@ -172,6 +184,8 @@ class UnresolvedFunctionCall(abc.ABC):
 
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def __getitem__(self, key: str) -> UnresolvedDict | UnresolvedList | Configuration:
         """Get an item from the result of the function call.
@@ -269,7 +283,7 @@ else:
     type _FunctionResult = Configuration
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class FunctionArgs:
     """Holds the arguments for a function call."""
 
@@ -394,7 +408,7 @@ type DynamicSchema = Callable[[Configuration, KeyPath], Schema]
 type KeyPath = tuple[str, ...]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class ResolutionContext:
     """Holds information available at the time that a node is resolved.
 
@@ -403,6 +403,31 @@ def test_splice_converts_to_target_schema():
     }
 
 
+def test_splice_same_keypath_into_destinations_with_different_schemas():
+    # given
+    schema: Schema = {
+        "type": "dict",
+        "required_keys": {
+            "baz": {"type": "dict", "required_keys": {"a": {"type": "integer"}}},
+            "foo": {"type": "dict", "required_keys": {"a": {"type": "string"}}},
+            "bar": {"type": "dict", "required_keys": {"a": {"type": "float"}}},
+        },
+    }
+
+    cfg: ConfigurationDict = {
+        "baz": {"a": 1},
+        "foo": {"__splice__": "baz"},
+        "bar": {"__splice__": "baz"},
+    }
+
+    # when
+    result = resolve(cfg, schema, functions={"splice": _splice})
+
+    # then
+    assert result == {"baz": {"a": 1}, "foo": {"a": "1"}, "bar": {"a": 1.0}}
+    assert type(result["bar"]["a"]) is float
+
+
 def test_splice_raises_if_key_does_not_exist():
     # given
     schema: Schema = {
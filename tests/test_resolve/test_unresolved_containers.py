@@ -163,3 +163,41 @@ def test_unresolved_dict_get_keypath_deeper_than_container_raises_keyerror():
 
     # when
     resolve(cfg, schema, functions={"inner": inner})
+
+
+def test_unresolved_dict_default_keys_can_be_iterated_more_than_once():
+    # given
+    class MinimalUnresolvedDict(UnresolvedDict):
+        """Implements only the abstract methods, relying on the default keys()."""
+
+        def __init__(self, data):
+            self.data = data
+
+        def __getitem__(self, key):
+            return self.data[key]
+
+        def __len__(self):
+            return len(self.data)
+
+        def __iter__(self):
+            return iter(self.data)
+
+        def values(self):
+            return self.data.values()
+
+        def resolve(self):
+            return dict(self.data)
+
+        def get_keypath(self, keypath):
+            return self.data[keypath]
+
+    dct = MinimalUnresolvedDict({"foo": 1, "bar": 2})
+
+    # when
+    keys = dct.keys()
+
+    # then
+    assert list(keys) == ["foo", "bar"]
+    assert list(keys) == ["foo", "bar"]
+    assert len(keys) == 2
+    assert "foo" in keys
@@ -607,6 +607,29 @@ def test_first_after():
     assert resolved == {"due": datetime.datetime(2021, 9, 13)}
 
 
+def test_first_excludes_the_reference_date_itself():
+    # 2021-09-13 is a Monday, so the first Monday after/before it is a week away
+    schema: Schema = {
+        "type": "dict",
+        "required_keys": {
+            "after": {"type": "datetime"},
+            "before": {"type": "datetime"},
+        },
+    }
+
+    cfg: ConfigurationDict = {
+        "after": {"__datetime.first__": {"weekday": "monday", "after": "2021-09-13"}},
+        "before": {"__datetime.first__": {"weekday": "monday", "before": "2021-09-13"}},
+    }
+
+    resolved = resolve(cfg, schema, functions={"datetime": {"first": first}})
+
+    assert resolved == {
+        "after": datetime.datetime(2021, 9, 20),
+        "before": datetime.datetime(2021, 9, 6),
+    }
+
+
 def test_first_after_multiple_choices_list():
     schema: Schema = {
         "type": "dict",
@@ -830,6 +853,44 @@ def test_first_raises_if_invalid_weekday():
     assert "Invalid day of week" in str(exc.value)
 
 
+def test_first_raises_if_weekday_list_is_empty():
+    schema: Schema = {
+        "type": "dict",
+        "required_keys": {
+            "due": {"type": "datetime"},
+        },
+    }
+
+    cfg: ConfigurationDict = {
+        "due": {"__datetime.first__": {"weekday": [], "after": "2021-09-10"}}
+    }
+
+    with raises(exceptions.ResolutionError) as exc:
+        resolve(cfg, schema, functions={"datetime": {"first": first}})
+
+    assert "At least one weekday is required" in str(exc.value)
+    assert exc.value.keypath == ("due",)
+
+
+def test_first_raises_if_weekday_string_names_no_days():
+    schema: Schema = {
+        "type": "dict",
+        "required_keys": {
+            "due": {"type": "datetime"},
+        },
+    }
+
+    cfg: ConfigurationDict = {
+        "due": {"__datetime.first__": {"weekday": " , ", "after": "2021-09-10"}}
+    }
+
+    with raises(exceptions.ResolutionError) as exc:
+        resolve(cfg, schema, functions={"datetime": {"first": first}})
+
+    assert "At least one weekday is required" in str(exc.value)
+    assert exc.value.keypath == ("due",)
+
+
 # first + skip ===================================================================
 
 
@@ -1217,3 +1278,20 @@ def test_parse_raises_if_invalid_weekday():
     with raises(exceptions.ResolutionError) as exc:
         resolve(cfg, PARSE_SCHEMA, functions=PARSE_FUNCTIONS)
     assert "Invalid day of week" in str(exc.value)
+
+
+def test_parse_raises_if_no_weekday_is_given():
+    cfg: ConfigurationDict = {
+        "result": {"__datetime.parse__": "first , after 2021-09-10"}
+    }
+    with raises(exceptions.ResolutionError) as exc:
+        resolve(cfg, PARSE_SCHEMA, functions=PARSE_FUNCTIONS)
+    assert "At least one weekday is required" in str(exc.value)
+    assert exc.value.keypath == ("result",)
+
+
+def test_parse_error_reports_the_keypath():
+    cfg: ConfigurationDict = {"result": {"__datetime.parse__": "not a date"}}
+    with raises(exceptions.ResolutionError) as exc:
+        resolve(cfg, PARSE_SCHEMA, functions=PARSE_FUNCTIONS)
+    assert exc.value.keypath == ("result",)
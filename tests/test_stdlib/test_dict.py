@@ -524,3 +524,46 @@ def test_from_items_raises_if_input_is_not_a_list_of_dicts_each_with_keys_key_an
     # when
     with raises(exceptions.ResolutionError):
         resolve(cfg, schema, functions={"from_items": from_items})
+
+
+def test_from_items_raises_if_a_key_is_not_a_string():
+    # given
+    schema: Schema = {
+        "type": "dict",
+        "required_keys": {
+            "1": {"type": "integer"},
+        },
+    }
+
+    cfg: ConfigurationDict = {
+        "__from_items__": [
+            {"key": 1, "value": 42},
+        ]
+    }
+
+    # when
+    with raises(exceptions.ResolutionError) as exc:
+        resolve(cfg, schema, functions={"from_items": from_items})
+
+    assert "Keys in 'from_items' must be strings, but got int." in str(exc.value)
+    assert exc.value.keypath == ()
+
+
+def test_from_items_raises_if_a_key_is_a_list():
+    # given
+    schema: Schema = {"type": "any"}
+
+    cfg: ConfigurationDict = {
+        "x": {
+            "__from_items__": [
+                {"key": ["a", "b"], "value": 42},
+            ]
+        }
+    }
+
+    # when
+    with raises(exceptions.ResolutionError) as exc:
+        resolve(cfg, schema, functions={"from_items": from_items})
+
+    assert "Keys in 'from_items' must be strings, but got list." in str(exc.value)
+    assert exc.value.keypath == ("x",)
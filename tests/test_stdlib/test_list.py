@@ -443,6 +443,28 @@ def test_filter_simple_example():
     assert resolved == [2, 4, 5]
 
 
+def test_filter_over_empty_list_does_not_evaluate_condition():
+    # given
+    schema: Schema = {
+        "type": "list",
+        "element_schema": {"type": "integer"},
+    }
+
+    cfg: ConfigurationDict = {
+        "__filter__": {
+            "iterable": [],
+            "variable": "x",
+            "condition": "${this_does_not_exist}",
+        }
+    }
+
+    # when
+    resolved = resolve(cfg, schema, functions={"filter": filter_})
+
+    # then
+    assert resolved == []
+
+
 def test_filter_raises_if_input_is_not_a_dict():
     # given
     schema: Schema = {